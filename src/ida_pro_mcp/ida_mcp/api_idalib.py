@@ -4,27 +4,88 @@ These tools are only available when running in idalib mode (headless MCP server)
 They enable dynamic loading and management of multiple binaries without restarting the server.
 """
 
-from typing import Annotated, Optional
-from pathlib import Path
+import sys
+from typing import Annotated, Callable, NotRequired, Optional, TypedDict
+
+# Bound manager methods, so tool calls skip the manager and attribute lookups.
+# They are only bound in idalib mode; every tool returns before using them otherwise.
+_open: "Callable[..., IDASession]"
+_close: Callable[[str], bool]
+_switch: Callable[[str], bool]
+_list: "Callable[[], ListResult]"
+_current: "Callable[[], Optional[IDASession]]"
 
 # Only import session manager in idalib mode
 try:
-    from ida_pro_mcp.idalib_session_manager import get_session_manager
-    IDALIB_MODE = True
+    from ida_pro_mcp.idalib_session_manager import IDASession, get_session_manager
 except ImportError:
     IDALIB_MODE = False
-    get_session_manager = None  # type: ignore
+else:
+    IDALIB_MODE = True
+    _manager = get_session_manager()
+    _open = _manager.open_binary
+    _close = _manager.close_session
+    _switch = _manager.switch_session
+    _list = _manager.get_cached_list_payload
+    _current = _manager.get_current_session
 
 from .rpc import tool
 # from .utils import AddrOrName
 
 
+class SessionInfo(TypedDict):
+    session_id: str
+    input_path: str
+    filename: str
+    created_at: str
+    last_accessed: str
+    is_analyzing: bool
+    metadata: dict
+    is_current: NotRequired[bool]
+
+
+class OpenResult(TypedDict):
+    success: bool
+    session: SessionInfo
+    message: str
+
+
+class CloseResult(TypedDict):
+    success: bool
+    message: str
+
+
+class SwitchResult(TypedDict):
+    success: bool
+    session: SessionInfo
+    message: str
+
+
+class ListResult(TypedDict):
+    sessions: list[SessionInfo]
+    count: int
+    current_session_id: Optional[str]
+
+
+class ErrorResult(TypedDict):
+    error: str
+    success: NotRequired[bool]
+
+
+# Shared by every tool outside idalib mode. The RPC layer only reads tool
+# results (truncation builds a new dict), so returning one instance is safe.
+_NOT_IDALIB_ERR: ErrorResult = {
+    "error": "This tool is only available in idalib mode. "
+            "Start the server with: idalib-mcp --host 127.0.0.1 --port 8745"
+}
+
+
 @tool
 def idalib_open(
     input_path: Annotated[str, "Path to the binary file to analyze"],
     run_auto_analysis: Annotated[bool, "Run automatic analysis on the binary"] = True,
     session_id: Annotated[Optional[str], "Custom session ID (auto-generated if not provided)"] = None,
-) -> dict:
+) -> OpenResult | ErrorResult:
     """Open a binary file and create a new IDA session (idalib mode only)
     
     Opens a binary file for analysis and creates a new session. The binary will be
@@ -56,40 +117,32 @@ def idalib_open(
         ```
     """
     if not IDALIB_MODE:
-        return {
-            "error": "This tool is only available in idalib mode. "
-                    "Start the server with: idalib-mcp --host 127.0.0.1 --port 8745"
-        }
+        return _NOT_IDALIB_ERR
     
+    session_id = sys.intern(session_id) if session_id is not None else None
     try:
-        manager = get_session_manager()
-        session_id_result = manager.open_binary(
-            Path(input_path),
+        session = _open(
+            input_path,
             run_auto_analysis=run_auto_analysis,
             session_id=session_id
         )
         
-        session = manager.get_session(session_id_result)
-        if session is None:
-            return {"error": f"Failed to retrieve session after opening: {session_id_result}"}
-        
+        info = session.to_dict()
         return {
             "success": True,
-            "session": session.to_dict(),
-            "message": f"Binary opened successfully: {session.input_path.name}"
+            "session": info,
+            "message": f"Binary opened successfully: {info['filename']}"
         }
     except FileNotFoundError as e:
         return {"error": str(e)}
     except RuntimeError as e:
         return {"error": f"Failed to open binary: {e}"}
-    except Exception as e:
-        return {"error": f"Unexpected error: {e}"}
 
 
 @tool
 def idalib_close(
     session_id: Annotated[str, "Session ID to close"]
-) -> dict:
+) -> CloseResult | ErrorResult:
     """Close an IDA session and its associated database (idalib mode only)
     
     Closes the specified session and releases all associated resources. If this is
@@ -112,32 +165,26 @@ def idalib_close(
         ```
     """
     if not IDALIB_MODE:
+        return _NOT_IDALIB_ERR
+    
+    session_id = sys.intern(session_id)
+    
+    if _close(session_id):
         return {
-            "error": "This tool is only available in idalib mode. "
-                    "Start the server with: idalib-mcp --host 127.0.0.1 --port 8745"
+            "success": True,
+            "message": f"Session closed: {session_id}"
+        }
+    else:
+        return {
+            "success": False,
+            "error": f"Session not found: {session_id}"
         }
-    
-    try:
-        manager = get_session_manager()
-        
-        if manager.close_session(session_id):
-            return {
-                "success": True,
-                "message": f"Session closed: {session_id}"
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Session not found: {session_id}"
-            }
-    except Exception as e:
-        return {"error": f"Failed to close session: {e}"}
 
 
 @tool
 def idalib_switch(
     session_id: Annotated[str, "Session ID to switch to"]
-) -> dict:
+) -> SwitchResult | ErrorResult:
     """Switch to a different IDA session (idalib mode only)
     
     Switches the active session to the specified session. This closes the current
@@ -167,34 +214,39 @@ def idalib_switch(
         ```
     """
     if not IDALIB_MODE:
+        return _NOT_IDALIB_ERR
+    
+    session_id = sys.intern(session_id)
+    
+    current = _current()
+    if current is not None and current.session_id == session_id:
         return {
-            "error": "This tool is only available in idalib mode. "
-                    "Start the server with: idalib-mcp --host 127.0.0.1 --port 8745"
+            "success": True,
+            "session": current.to_dict(),
+            "message": f"Already on session: {session_id}"
         }
     
     try:
-        manager = get_session_manager()
-        
-        if manager.switch_session(session_id):
-            session = manager.get_current_session()
-            if session is None:
-                return {"error": "Failed to retrieve current session after switching"}
-            
-            return {
-                "success": True,
-                "session": session.to_dict(),
-                "message": f"Switched to session: {session_id} ({session.input_path.name})"
-            }
+        _switch(session_id)
     except ValueError as e:
         return {"error": str(e)}
     except RuntimeError as e:
         return {"error": f"Failed to switch session: {e}"}
-    except Exception as e:
-        return {"error": f"Unexpected error: {e}"}
+    
+    session = _current()
+    if session is None:
+        return {"error": "Failed to retrieve current session after switching"}
+    
+    info = session.to_dict()
+    return {
+        "success": True,
+        "session": info,
+        "message": f"Switched to session: {session_id} ({info['filename']})"
+    }
 
 
 @tool
-def idalib_list() -> dict:
+def idalib_list() -> ListResult | ErrorResult:
     """List all open IDA sessions (idalib mode only)
     
     Returns a list of all currently open sessions with their metadata. The current
@@ -235,27 +287,13 @@ def idalib_list() -> dict:
         ```
     """
     if not IDALIB_MODE:
-        return {
-            "error": "This tool is only available in idalib mode. "
-                    "Start the server with: idalib-mcp --host 127.0.0.1 --port 8745"
-        }
+        return _NOT_IDALIB_ERR
     
-    try:
-        manager = get_session_manager()
-        sessions = manager.list_sessions()
-        current_session = manager.get_current_session()
-        
-        return {
-            "sessions": sessions,
-            "count": len(sessions),
-            "current_session_id": current_session.session_id if current_session else None
-        }
-    except Exception as e:
-        return {"error": f"Failed to list sessions: {e}"}
+    return _list()
 
 
 @tool
-def idalib_current() -> dict:
+def idalib_current() -> SessionInfo | ErrorResult:
     """Get information about the current active IDA session (idalib mode only)
     
     Returns detailed information about the currently active session, or an error
@@ -285,20 +323,13 @@ def idalib_current() -> dict:
         ```
     """
     if not IDALIB_MODE:
+        return _NOT_IDALIB_ERR
+    
+    session = _current()
+    
+    if session is None:
         return {
-            "error": "This tool is only available in idalib mode. "
-                    "Start the server with: idalib-mcp --host 127.0.0.1 --port 8745"
+            "error": "No active session. Use idalib_open() to open a binary first."
         }
     
-    try:
-        manager = get_session_manager()
-        session = manager.get_current_session()
-        
-        if session is None:
-            return {
-                "error": "No active session. Use idalib_open() to open a binary first."
-            }
-        
-        return session.to_dict()
-    except Exception as e:
-        return {"error": f"Failed to get current session: {e}"}
+    return session.to_dict()
@@ -1,4 +1,13 @@
 # NOTE: Vendored from zeromcp 1.3.0
+#
+# Local patches (re-apply when re-vendoring):
+# - jsonrpc.py: JsonRpcRegistry._call builds one validator per parameter
+#   (_make_validator) when a method is first called, instead of decomposing
+#   the type hints on every call. tests/jsonrpc_validation.py pins the
+#   original behavior.
+# - mcp.py: McpServer._generate_tool_schema does not wrap a union of object
+#   return types (e.g. OkResult | ErrorResult) in a "result" property, since
+#   dict results are returned as structuredContent unwrapped.
 
 from .mcp import McpRpcRegistry, McpToolError, McpServer, McpHttpRequestHandler
 
@@ -109,9 +109,15 @@ class JsonRpcRegistry:
                 if param.default is inspect.Parameter.empty:
                     required_params.append(param_name)
 
-            self._cache[func] = (sig, hints, required_params)
+            # Resolve the type checks once instead of on every call
+            validators = {
+                param_name: _make_validator(param_name, expected_type)
+                for param_name, expected_type in hints.items()
+            }
+
+            self._cache[func] = (sig, validators, required_params)
 
-        sig, hints, required_params = self._cache[func]
+        sig, validators, required_params = self._cache[func]
 
         # Handle None params
         if params is None:
@@ -155,87 +161,14 @@ class JsonRpcRegistry:
             validated_params = {}
             for param_name, value in params.items():
                 # If no type hint, pass through without validation
-                if param_name not in hints:
+                validator = validators.get(param_name)
+                if validator is None:
                     validated_params[param_name] = value
                     continue
 
-                # Has type hint, validate
-                expected_type = hints[param_name]
-
-                # Inline type validation
-                origin = get_origin(expected_type)
-                args = get_args(expected_type)
-
-                # Handle None/null
-                if value is None:
-                    if expected_type is not type(None):
-                        # Check if None is allowed in a Union
-                        if not (origin in (Union, UnionType) and type(None) in args):
-                            raise JsonRpcException(-32602, f"Invalid params: {param_name} cannot be null")
-                    validated_params[param_name] = None
-                    continue
-
-                # Handle Union types (int | str, Optional[int], etc.)
-                if origin in (Union, UnionType):
-                    type_matched = False
-                    for arg_type in args:
-                        if arg_type is type(None):
-                            continue
-
-                        arg_origin = get_origin(arg_type)
-                        check_type = arg_origin if arg_origin is not None else arg_type
-
-                        # TypedDict cannot be used with isinstance - check for dict instead
-                        if is_typeddict(arg_type):
-                            check_type = dict
-
-                        if isinstance(value, check_type):
-                            type_matched = True
-                            break
-
-                    if not type_matched:
-                        raise JsonRpcException(-32602, f"Invalid params: {param_name} union does not contain {type(value).__name__}")
-                    validated_params[param_name] = value
-                    continue
-
-                # Handle generic types (list[X], dict[K,V])
-                if origin is not None:
-                    if not isinstance(value, origin):
-                        raise JsonRpcException(
-                            -32602,
-                            f"Invalid params: {param_name} expected {origin.__name__}, got {type(value).__name__}"
-                        )
+                value = validator(value)
+                if value is not _UNCHECKED:
                     validated_params[param_name] = value
-                    continue
-
-                # Handle TypedDict (must check before basic types)
-                if is_typeddict(expected_type):
-                    if not isinstance(value, dict):
-                        raise JsonRpcException(
-                            -32602,
-                            f"Invalid params: {param_name} expected dict, got {type(value).__name__}"
-                        )
-                    validated_params[param_name] = value
-                    continue
-
-                # Handle Any
-                if expected_type is Any:
-                    validated_params[param_name] = value
-                    continue
-
-                # Handle basic types
-                if isinstance(expected_type, type):
-                    # Allow int -> float conversion
-                    if expected_type is float and isinstance(value, int):
-                        validated_params[param_name] = float(value)
-                        continue
-                    if not isinstance(value, expected_type):
-                        raise JsonRpcException(
-                            -32602,
-                            f"Invalid params: {param_name} expected {expected_type.__name__}, got {type(value).__name__}"
-                        )
-                    validated_params[param_name] = value
-                    continue
 
             return func(**validated_params)
 
@@ -254,3 +187,103 @@ class JsonRpcRegistry:
             "error": error,
             "id": request_id,
         }
+
+# Returned by validators for type hints they cannot check, the parameter is dropped
+_UNCHECKED = object()
+
+def _make_validator(param_name: str, expected_type: Any) -> Callable[[Any], Any]:
+    """Build a function that validates (and converts) a value for a parameter"""
+    origin = get_origin(expected_type)
+    args = get_args(expected_type)
+    is_union = origin in (Union, UnionType)
+
+    # Handle None/null
+    nullable = expected_type is type(None) or (is_union and type(None) in args)
+
+    def check_null() -> None:
+        if not nullable:
+            raise JsonRpcException(-32602, f"Invalid params: {param_name} cannot be null")
+        return None
+
+    # Handle Union types (int | str, Optional[int], etc.)
+    if is_union:
+        check_types = []
+        for arg_type in args:
+            if arg_type is type(None):
+                continue
+
+            arg_origin = get_origin(arg_type)
+            check_type = arg_origin if arg_origin is not None else arg_type
+
+            # TypedDict cannot be used with isinstance - check for dict instead
+            if is_typeddict(arg_type):
+                check_type = dict
+
+            check_types.append(check_type)
+        union_types = tuple(check_types)
+
+        def validate_union(value: Any) -> Any:
+            if value is None:
+                return check_null()
+            if not isinstance(value, union_types):
+                raise JsonRpcException(-32602, f"Invalid params: {param_name} union does not contain {type(value).__name__}")
+            return value
+        return validate_union
+
+    # Handle generic types (list[X], dict[K,V])
+    if origin is not None:
+        def validate_generic(value: Any) -> Any:
+            if value is None:
+                return check_null()
+            if not isinstance(value, origin):
+                raise JsonRpcException(
+                    -32602,
+                    f"Invalid params: {param_name} expected {origin.__name__}, got {type(value).__name__}"
+                )
+            return value
+        return validate_generic
+
+    # Handle TypedDict (must check before basic types)
+    if is_typeddict(expected_type):
+        def validate_typeddict(value: Any) -> Any:
+            if value is None:
+                return check_null()
+            if not isinstance(value, dict):
+                raise JsonRpcException(
+                    -32602,
+                    f"Invalid params: {param_name} expected dict, got {type(value).__name__}"
+                )
+            return value
+        return validate_typeddict
+
+    # Handle Any
+    if expected_type is Any:
+        def validate_any(value: Any) -> Any:
+            if value is None:
+                return check_null()
+            return value
+        return validate_any
+
+    # Handle basic types
+    if isinstance(expected_type, type):
+        # Allow int -> float conversion
+        is_float = expected_type is float
+
+        def validate_basic(value: Any) -> Any:
+            if value is None:
+                return check_null()
+            if is_float and isinstance(value, int):
+                return float(value)
+            if not isinstance(value, expected_type):
+                raise JsonRpcException(
+                    -32602,
+                    f"Invalid params: {param_name} expected {expected_type.__name__}, got {type(value).__name__}"
+                )
+            return value
+        return validate_basic
+
+    def validate_unchecked(value: Any) -> Any:
+        if value is None:
+            return check_null()
+        return _UNCHECKED
+    return validate_unchecked
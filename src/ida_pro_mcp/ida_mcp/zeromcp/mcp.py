@@ -635,6 +635,12 @@ class McpServer:
             "additionalProperties": False,
         }
 
+    def _is_object_schema(self, schema: dict) -> bool:
+        """Check if a schema describes an object (or a union of objects)"""
+        if "anyOf" in schema:
+            return all(self._is_object_schema(s) for s in schema["anyOf"])
+        return schema.get("type") == "object"
+
     def _generate_tool_schema(self, func_name: str, func: Callable) -> dict:
         """Generate MCP tool schema from a function"""
         hints = get_type_hints(func, include_extras=True)
@@ -668,7 +674,7 @@ class McpServer:
             return_schema = self._type_to_json_schema(return_type)
 
             # Wrap non-object returns in a "result" property
-            if return_schema.get("type") != "object":
+            if not self._is_object_schema(return_schema):
                 return_schema = {
                     "type": "object",
                     "properties": {"result": return_schema},
@@ -33,8 +33,8 @@ def main():
     parser.add_argument(
         "input_path", 
         type=Path, 
-        nargs="?",  # Make input_path optional
-        help="Path to the input file to analyze (optional, can be loaded dynamically via MCP tools)."
+        nargs="*",  # Make input_path optional
+        help="Path(s) to the input file(s) to analyze (optional, can be loaded dynamically via MCP tools)."
     )
     args = parser.parse_args()
 
@@ -55,29 +55,32 @@ def main():
     from ida_pro_mcp.idalib_session_manager import get_session_manager
     session_manager = get_session_manager()
 
-    # Open initial binary if provided
-    if args.input_path is not None:
-        if not args.input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {args.input_path}")
-
-        logger.info("opening initial database: %s", args.input_path)
-        session_id = session_manager.open_binary(args.input_path, run_auto_analysis=True)
-        logger.info(f"Initial session created: {session_id}")
+    # Open initial binaries if provided
+    if args.input_path:
+        logger.info("opening initial databases: %s", ", ".join(map(str, args.input_path)))
+        try:
+            sessions = session_manager.open_binaries(args.input_path, run_auto_analysis=True)
+        except FileNotFoundError as e:
+            logger.error("%s", e)
+            sys.exit(1)
+        for session in sessions:
+            logger.info("Initial session created: %s", session.session_id)
     else:
         logger.info("No initial binary specified. Use idalib_open() to load binaries dynamically.")
 
     # Setup signal handlers to ensure IDA database is properly closed on shutdown.
     # When a signal arrives, our handlers execute first, allowing us to close the
     # IDA database cleanly before the process terminates.
-    def cleanup_and_exit(signum, frame):
+    # The manager is bound as a default argument rather than captured in a closure.
+    def cleanup_and_exit(signum, frame, _manager=session_manager):
         logger.info("Shutting down...")
         logger.info("Closing all IDA sessions...")
-        session_manager.close_all_sessions()
+        _manager.close_all_sessions()
         logger.info("All sessions closed.")
         sys.exit(0)
 
-    signal.signal(signal.SIGINT, cleanup_and_exit)
-    signal.signal(signal.SIGTERM, cleanup_and_exit)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, cleanup_and_exit)
 
     # NOTE: npx -y @modelcontextprotocol/inspector for debugging
     # TODO: with background=True the main thread (this one) does not fake any
@@ -5,38 +5,105 @@ Each session represents an opened binary with its own IDA database instance.
 """
 
 import os
+import sys
+import time
 import uuid
 import threading
 import logging
+import functools
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import idapro
 import ida_auto
 
+if TYPE_CHECKING:
+    from ida_pro_mcp.ida_mcp.api_idalib import ListResult, SessionInfo
+
 logger = logging.getLogger(__name__)
 
 
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert a time.time_ns() timestamp to a local datetime"""
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=remainder // 1000)
+
+
+def _resolve_input_path(input_path: Path | str) -> tuple[str, str]:
+    """Normalize an input path and check that it exists
+    
+    Returns:
+        Tuple of (absolute path, fully resolved path)
+        
+    Raises:
+        FileNotFoundError: If the path cannot be resolved
+    """
+    input_path = os.path.abspath(input_path)
+    
+    # Resolving strictly doubles as the existence check, so the path is
+    # only looked at once instead of exists() followed by resolve().
+    # Like Path.exists(), treat any OSError (ENOTDIR, ELOOP, ...) as missing.
+    try:
+        resolved_path = os.path.realpath(input_path, strict=True)
+    except OSError:
+        raise FileNotFoundError(f"Input file not found: {input_path}") from None
+    return input_path, resolved_path
+
+
 @dataclass
 class IDASession:
     """Represents a single IDA database session"""
     session_id: str
-    input_path: Path
-    created_at: datetime = field(default_factory=datetime.now)
-    last_accessed: datetime = field(default_factory=datetime.now)
+    input_path: str
     is_analyzing: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Timestamps are kept as integers and only formatted when serialized
+    _created_ns: int = field(default_factory=time.time_ns, init=False, repr=False, compare=False)
+    _last_accessed_ns: int = field(default=0, init=False, repr=False, compare=False)
+    _filename: str = field(init=False, repr=False, compare=False)
+    _created_iso: str = field(init=False, repr=False, compare=False)
+    _last_accessed_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Fully resolved input path, set by the manager for duplicate detection
+    _resolved_path: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._last_accessed_ns = self._created_ns
+        # Fields that never change for the lifetime of the session
+        self._filename = os.path.basename(self.input_path)
+        self._created_iso = self.created_at.isoformat()
+    
+    @property
+    def created_at(self) -> datetime:
+        """Session creation time"""
+        return _ns_to_datetime(self._created_ns)
+    
+    @property
+    def last_accessed(self) -> datetime:
+        """Time the session was last opened or switched to"""
+        return _ns_to_datetime(self._last_accessed_ns)
     
-    def to_dict(self) -> dict:
+    @functools.cached_property
+    def path(self) -> Path:
+        """Input path as a Path, for callers that need path operations"""
+        return Path(self.input_path)
+    
+    def touch(self):
+        """Mark the session as accessed now"""
+        self._last_accessed_ns = time.time_ns()
+        self._last_accessed_iso = None
+    
+    def to_dict(self) -> "SessionInfo":
         """Convert session to dictionary format"""
+        if self._last_accessed_iso is None:
+            self._last_accessed_iso = self.last_accessed.isoformat()
         return {
             "session_id": self.session_id,
-            "input_path": str(self.input_path),
-            "filename": self.input_path.name,
-            "created_at": self.created_at.isoformat(),
-            "last_accessed": self.last_accessed.isoformat(),
+            "input_path": self.input_path,
+            "filename": self._filename,
+            "created_at": self._created_iso,
+            "last_accessed": self._last_accessed_iso,
             "is_analyzing": self.is_analyzing,
             "metadata": self.metadata,
         }
@@ -46,8 +113,12 @@ class IDASessionManager:
     """Manages multiple IDA database sessions for idalib mode"""
     
     def __init__(self):
+        # Copy-on-write: writers publish a new dict under the lock, readers
+        # grab the current reference without locking. Never mutate in place.
         self._sessions: Dict[str, IDASession] = {}
         self._current_session_id: Optional[str] = None
+        self._snapshot: "Optional[list[SessionInfo]]" = None
+        self._list_payload: "Optional[ListResult]" = None
         self._lock = threading.RLock()
         logger.info("IDASessionManager initialized")
     
@@ -56,7 +127,7 @@ class IDASessionManager:
         input_path: Path | str, 
         run_auto_analysis: bool = True,
         session_id: Optional[str] = None
-    ) -> str:
+    ) -> IDASession:
         """Open a binary file and create a new session
         
         Args:
@@ -65,25 +136,33 @@ class IDASessionManager:
             session_id: Optional custom session ID (auto-generated if not provided)
             
         Returns:
-            Session ID for the opened binary
+            Session for the opened binary (the existing one if already open)
             
         Raises:
             FileNotFoundError: If the input file doesn't exist
             RuntimeError: If failed to open the database
         """
-        input_path = Path(input_path)
-        
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
-        
+        input_path, resolved_path = _resolve_input_path(input_path)
+        return self._open_resolved(input_path, resolved_path, run_auto_analysis, session_id)
+    
+    def _open_resolved(
+        self,
+        input_path: str,
+        resolved_path: str,
+        run_auto_analysis: bool,
+        session_id: Optional[str]
+    ) -> IDASession:
+        """Open a binary whose path was already checked by _resolve_input_path"""
         with self._lock:
             # Check if this file is already open
             for sid, session in self._sessions.items():
-                if session.input_path.resolve() == input_path.resolve():
-                    logger.info(f"Binary already open in session: {sid}")
-                    self._current_session_id = sid
-                    session.last_accessed = datetime.now()
-                    return sid
+                if session._resolved_path == resolved_path:
+                    logger.info("Binary already open in session: %s", sid)
+                    # Make sure IDA actually has this database loaded
+                    self.switch_session(sid)
+                    session.touch()
+                    self._invalidate_snapshot()
+                    return session
             
             # Close current database if any (Do we need to close the database first?)
             if self._current_session_id is not None:
@@ -93,11 +172,13 @@ class IDASessionManager:
             # Generate session ID
             if session_id is None:
                 session_id = str(uuid.uuid4())[:8]
+            # Interned keys let lookups with interned IDs compare by identity
+            session_id = sys.intern(session_id)
             
             # Open the database
-            logger.info(f"Opening database: {input_path} (session: {session_id})")
+            logger.info("Opening database: %s (session: %s)", input_path, session_id)
             
-            if idapro.open_database(str(input_path), run_auto_analysis=run_auto_analysis):
+            if idapro.open_database(input_path, run_auto_analysis=run_auto_analysis):
                 raise RuntimeError(f"Failed to open database: {input_path}")
             
             # Create session object
@@ -106,19 +187,56 @@ class IDASessionManager:
                 input_path=input_path,
                 is_analyzing=run_auto_analysis,
             )
+            session._resolved_path = resolved_path
             
-            self._sessions[session_id] = session
+            self._sessions = {**self._sessions, session_id: session}
             self._current_session_id = session_id
+            self._invalidate_snapshot()
             
             # Wait for analysis if requested
             if run_auto_analysis:
-                logger.debug(f"Waiting for auto-analysis to complete (session: {session_id})")
-                ida_auto.auto_wait()
-                session.is_analyzing = False
-                logger.info(f"Auto-analysis completed (session: {session_id})")
+                logger.debug("Waiting for auto-analysis to complete (session: %s)", session_id)
+                try:
+                    ida_auto.auto_wait()
+                finally:
+                    session.is_analyzing = False
+                    self._invalidate_snapshot()
+                logger.info("Auto-analysis completed (session: %s)", session_id)
+            
+            logger.info("Session created: %s for %s", session_id, session._filename)
+            return session
+    
+    def open_binaries(
+        self,
+        input_paths: list[Path | str],
+        run_auto_analysis: bool = True
+    ) -> list[IDASession]:
+        """Open several binary files in one pass, creating a session for each
+        
+        The binaries are opened in order while holding the lock once, so the
+        last one ends up as the current session. idalib holds a single database
+        at a time and its API is not thread-safe, so analysis cannot overlap;
+        instead every path is checked up front so a missing file is reported
+        before any (potentially long) auto-analysis runs.
+        
+        Args:
+            input_paths: Paths to the binary files
+            run_auto_analysis: Whether to run auto-analysis
+            
+        Returns:
+            Sessions for the opened binaries, in the same order as input_paths
             
-            logger.info(f"Session created: {session_id} for {input_path.name}")
-            return session_id
+        Raises:
+            FileNotFoundError: If an input file doesn't exist
+            RuntimeError: If failed to open a database
+        """
+        resolved = [_resolve_input_path(input_path) for input_path in input_paths]
+        
+        with self._lock:
+            return [
+                self._open_resolved(input_path, resolved_path, run_auto_analysis, None)
+                for input_path, resolved_path in resolved
+            ]
     
     def close_session(self, session_id: str) -> bool:
         """Close a specific session and its database
@@ -131,11 +249,11 @@ class IDASessionManager:
         """
         with self._lock:
             if session_id not in self._sessions:
-                logger.warning(f"Session not found: {session_id}")
+                logger.warning("Session not found: %s", session_id)
                 return False
             
             session = self._sessions[session_id]
-            logger.info(f"Closing session: {session_id} ({session.input_path.name})")
+            logger.info("Closing session: %s (%s)", session_id, session._filename)
             
             # If this is the current session, close the database
             if self._current_session_id == session_id:
@@ -143,8 +261,11 @@ class IDASessionManager:
                 self._current_session_id = None
             
             # Remove session
-            del self._sessions[session_id]
-            logger.info(f"Session closed: {session_id}")
+            sessions = dict(self._sessions)
+            del sessions[session_id]
+            self._sessions = sessions
+            self._invalidate_snapshot()
+            logger.info("Session closed: %s", session_id)
             return True
     
     def switch_session(self, session_id: str) -> bool:
@@ -159,31 +280,37 @@ class IDASessionManager:
         Raises:
             ValueError: If session not found
         """
+        # Switching closes and reopens the database, skip it for the current one
+        if self._current_session_id == session_id:
+            logger.debug("Already on session: %s", session_id)
+            return True
+        
         with self._lock:
             if session_id not in self._sessions:
                 raise ValueError(f"Session not found: {session_id}")
             
             if self._current_session_id == session_id:
-                logger.debug(f"Already on session: {session_id}")
+                logger.debug("Already on session: %s", session_id)
                 return True
             
             session = self._sessions[session_id]
             
             # Close current database
             if self._current_session_id is not None:
-                logger.debug(f"Closing current session: {self._current_session_id}")
+                logger.debug("Closing current session: %s", self._current_session_id)
                 idapro.close_database()
             
             # Open the target session's database
-            logger.info(f"Switching to session: {session_id} ({session.input_path.name})")
+            logger.info("Switching to session: %s (%s)", session_id, session._filename)
             
-            if idapro.open_database(str(session.input_path), run_auto_analysis=False):
+            if idapro.open_database(session.input_path, run_auto_analysis=False):
                 raise RuntimeError(f"Failed to switch to session: {session_id}")
             
             self._current_session_id = session_id
-            session.last_accessed = datetime.now()
+            session.touch()
+            self._invalidate_snapshot()
             
-            logger.info(f"Switched to session: {session_id}")
+            logger.info("Switched to session: %s", session_id)
             return True
     
     def get_current_session(self) -> Optional[IDASession]:
@@ -192,25 +319,67 @@ class IDASessionManager:
         Returns:
             Current session or None if no active session
         """
-        with self._lock:
-            if self._current_session_id is None:
-                return None
-            return self._sessions.get(self._current_session_id)
+        current_session_id = self._current_session_id
+        if current_session_id is None:
+            return None
+        return self._sessions.get(current_session_id)
     
-    def list_sessions(self) -> list[dict]:
+    def list_sessions(self) -> "list[SessionInfo]":
         """List all open sessions
         
         Returns:
             List of session dictionaries with metadata
         """
+        sessions = self._sessions
+        current_session_id = self._current_session_id
+        return [
+            {
+                **session.to_dict(),
+                "is_current": session.session_id == current_session_id,
+            }
+            for session in sessions.values()
+        ]
+    
+    def get_cached_sessions_snapshot(self) -> "list[SessionInfo]":
+        """List all open sessions, reusing the last result until sessions change
+
+        The snapshot is invalidated whenever a session is opened, closed or
+        switched to. Callers must treat the returned list as read-only.
+
+        Returns:
+            List of session dictionaries with metadata
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
         with self._lock:
-            return [
-                {
-                    **session.to_dict(),
-                    "is_current": session.session_id == self._current_session_id,
+            if self._snapshot is None:
+                self._snapshot = self.list_sessions()
+            return self._snapshot
+    
+    def get_cached_list_payload(self) -> "ListResult":
+        """Get the idalib_list response, reusing it until sessions change
+        
+        Returns:
+            Dictionary with the sessions snapshot, count and current session ID
+        """
+        payload = self._list_payload
+        if payload is not None:
+            return payload
+        with self._lock:
+            if self._list_payload is None:
+                sessions = self.get_cached_sessions_snapshot()
+                self._list_payload = {
+                    "sessions": sessions,
+                    "count": len(sessions),
+                    "current_session_id": self._current_session_id,
                 }
-                for session in self._sessions.values()
-            ]
+            return self._list_payload
+    
+    def _invalidate_snapshot(self):
+        """Drop cached session listings after the sessions changed"""
+        self._snapshot = None
+        self._list_payload = None
     
     def get_session(self, session_id: str) -> Optional[IDASession]:
         """Get a specific session by ID
@@ -221,19 +390,19 @@ class IDASessionManager:
         Returns:
             Session object or None if not found
         """
-        with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
     
     def close_all_sessions(self):
         """Close all sessions and databases"""
         with self._lock:
-            logger.info(f"Closing all {len(self._sessions)} sessions")
+            logger.info("Closing all %s sessions", len(self._sessions))
             
             if self._current_session_id is not None:
                 idapro.close_database()
                 self._current_session_id = None
             
-            self._sessions.clear()
+            self._sessions = {}
+            self._invalidate_snapshot()
             logger.info("All sessions closed")
 
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""JSON-RPC parameter validation regression check
+
+The vendored zeromcp registry (src/ida_pro_mcp/ida_mcp/zeromcp/jsonrpc.py)
+carries a local patch that precompiles one validator per parameter instead of
+inspecting the type hints on every call. This script pins the behavior of the
+original per-call validation: every (annotation, value) pair below was
+recorded from the unpatched zeromcp 1.3.0 dispatcher. Run it after touching
+the validation code or re-vendoring zeromcp. It does not need IDA.
+
+Usage:
+    uv run python tests/jsonrpc_validation.py
+"""
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from typing import Any, Optional, TypedDict, TypeVar
+
+ZEROMCP_DIR = Path(__file__).resolve().parent.parent / "src" / "ida_pro_mcp" / "ida_mcp" / "zeromcp"
+
+
+def _load_zeromcp():
+    # Import zeromcp on its own, the ida_mcp package requires IDA
+    spec = importlib.util.spec_from_file_location(
+        "zeromcp", ZEROMCP_DIR / "__init__.py", submodule_search_locations=[str(ZEROMCP_DIR)]
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["zeromcp"] = module
+    spec.loader.exec_module(module)
+    return sys.modules["zeromcp.jsonrpc"]
+
+
+jsonrpc = _load_zeromcp()
+
+
+class Point(TypedDict):
+    x: int
+
+
+T = TypeVar("T")
+
+
+class OK:
+    """Expected successful call, returning the value the tool received"""
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+# (annotation, argument, OK(value passed to the function) or error message
+# without the "Invalid params: x " prefix). A parameter whose annotation
+# cannot be checked (T) is dropped, so the function sees its default.
+CASES = [
+    (int, None, "cannot be null"),
+    (int, 1, OK(1)),
+    (int, 1.5, "expected int, got float"),
+    (int, "x", "expected int, got str"),
+    (int, True, OK(True)),
+    (int, [1], "expected int, got list"),
+    (int, {"x": 1}, "expected int, got dict"),
+    (float, None, "cannot be null"),
+    (float, 1, OK(1.0)),
+    (float, 1.5, OK(1.5)),
+    (float, "x", "expected float, got str"),
+    (float, True, OK(1.0)),
+    (float, [1], "expected float, got list"),
+    (float, {"x": 1}, "expected float, got dict"),
+    (str, None, "cannot be null"),
+    (str, 1, "expected str, got int"),
+    (str, 1.5, "expected str, got float"),
+    (str, "x", OK("x")),
+    (str, True, "expected str, got bool"),
+    (str, [1], "expected str, got list"),
+    (str, {"x": 1}, "expected str, got dict"),
+    (bool, None, "cannot be null"),
+    (bool, 1, "expected bool, got int"),
+    (bool, 1.5, "expected bool, got float"),
+    (bool, "x", "expected bool, got str"),
+    (bool, True, OK(True)),
+    (bool, [1], "expected bool, got list"),
+    (bool, {"x": 1}, "expected bool, got dict"),
+    (Optional[int], None, OK(None)),
+    (Optional[int], 1, OK(1)),
+    (Optional[int], 1.5, "union does not contain float"),
+    (Optional[int], "x", "union does not contain str"),
+    (Optional[int], True, OK(True)),
+    (Optional[int], [1], "union does not contain list"),
+    (Optional[int], {"x": 1}, "union does not contain dict"),
+    (int | str, None, "cannot be null"),
+    (int | str, 1, OK(1)),
+    (int | str, 1.5, "union does not contain float"),
+    (int | str, "x", OK("x")),
+    (int | str, True, OK(True)),
+    (int | str, [1], "union does not contain list"),
+    (int | str, {"x": 1}, "union does not contain dict"),
+    (list[int], None, "cannot be null"),
+    (list[int], 1, "expected list, got int"),
+    (list[int], 1.5, "expected list, got float"),
+    (list[int], "x", "expected list, got str"),
+    (list[int], True, "expected list, got bool"),
+    (list[int], [1], OK([1])),
+    (list[int], {"x": 1}, "expected list, got dict"),
+    (dict[str, int], None, "cannot be null"),
+    (dict[str, int], 1, "expected dict, got int"),
+    (dict[str, int], 1.5, "expected dict, got float"),
+    (dict[str, int], "x", "expected dict, got str"),
+    (dict[str, int], True, "expected dict, got bool"),
+    (dict[str, int], [1], "expected dict, got list"),
+    (dict[str, int], {"x": 1}, OK({"x": 1})),
+    (Point, None, "cannot be null"),
+    (Point, 1, "expected dict, got int"),
+    (Point, 1.5, "expected dict, got float"),
+    (Point, "x", "expected dict, got str"),
+    (Point, True, "expected dict, got bool"),
+    (Point, [1], "expected dict, got list"),
+    (Point, {"x": 1}, OK({"x": 1})),
+    (Any, None, "cannot be null"),
+    (Any, 1, OK(1)),
+    (Any, 1.5, OK(1.5)),
+    (Any, "x", OK("x")),
+    (Any, True, OK(True)),
+    (Any, [1], OK([1])),
+    (Any, {"x": 1}, OK({"x": 1})),
+    (Optional[Point], None, OK(None)),
+    (Optional[Point], 1, "union does not contain int"),
+    (Optional[Point], 1.5, "union does not contain float"),
+    (Optional[Point], "x", "union does not contain str"),
+    (Optional[Point], True, "union does not contain bool"),
+    (Optional[Point], [1], "union does not contain list"),
+    (Optional[Point], {"x": 1}, OK({"x": 1})),
+    (type(None), None, OK(None)),
+    (type(None), 1, "expected NoneType, got int"),
+    (type(None), 1.5, "expected NoneType, got float"),
+    (type(None), "x", "expected NoneType, got str"),
+    (type(None), True, "expected NoneType, got bool"),
+    (type(None), [1], "expected NoneType, got list"),
+    (type(None), {"x": 1}, "expected NoneType, got dict"),
+    (T, None, "cannot be null"),
+    (T, 1, OK(None)),
+    (T, 1.5, OK(None)),
+    (T, "x", OK(None)),
+    (T, True, OK(None)),
+    (T, [1], OK(None)),
+    (T, {"x": 1}, OK(None)),
+    (list[str] | str, None, "cannot be null"),
+    (list[str] | str, 1, "union does not contain int"),
+    (list[str] | str, 1.5, "union does not contain float"),
+    (list[str] | str, "x", OK("x")),
+    (list[str] | str, True, "union does not contain bool"),
+    (list[str] | str, [1], OK([1])),
+    (list[str] | str, {"x": 1}, "union does not contain dict"),
+]
+
+
+class ValidationTest(unittest.TestCase):
+    def test_dispatch_matches_recorded_behavior(self):
+        for annotation, value, expected in CASES:
+            with self.subTest(annotation=annotation, value=value):
+
+                def func(x=None):
+                    return x
+
+                func.__annotations__ = {"x": annotation}
+                registry = jsonrpc.JsonRpcRegistry()
+                registry.method(func)
+                # Call twice: the first call builds the cached validators
+                for _ in range(2):
+                    response = registry.dispatch(
+                        {"jsonrpc": "2.0", "method": "func", "params": {"x": value}, "id": 1}
+                    )
+                    if isinstance(expected, OK):
+                        self.assertNotIn("error", response)
+                        self.assertEqual(response["result"], expected.value)
+                        self.assertIs(type(response["result"]), type(expected.value))
+                    else:
+                        self.assertEqual(response["error"]["message"], "Invalid params: x " + expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
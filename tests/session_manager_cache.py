@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Session listing cache regression check
+
+IDASessionManager caches the idalib_list payload and the sessions snapshot
+it is built from, and drops both whenever a session is opened, closed or
+switched to. This script walks a manager through those transitions and
+checks that every listing reflects the current state. idapro and ida_auto
+are replaced by stubs, so it does not need IDA.
+
+Usage:
+    uv run python tests/session_manager_cache.py
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+SESSION_MANAGER_PATH = Path(__file__).resolve().parent.parent / "src" / "ida_pro_mcp" / "idalib_session_manager.py"
+
+
+class IdaStubs:
+    """Stand-ins for the idapro and ida_auto modules"""
+
+    def __init__(self):
+        self.idapro = types.ModuleType("idapro")
+        self.idapro.open_database = self.open_database
+        self.idapro.close_database = self.close_database
+        self.ida_auto = types.ModuleType("ida_auto")
+        self.ida_auto.auto_wait = self.auto_wait
+        self.open_path = None
+        # Called from auto_wait while the new session is still analyzing
+        self.on_auto_wait = None
+
+    def open_database(self, input_path, run_auto_analysis=True):
+        self.open_path = input_path
+        return 0
+
+    def close_database(self):
+        self.open_path = None
+
+    def auto_wait(self):
+        if self.on_auto_wait is not None:
+            self.on_auto_wait()
+        return True
+
+
+def _load_session_manager(stubs: IdaStubs):
+    # Import the module on its own, ida_pro_mcp.ida_mcp requires IDA
+    sys.modules["idapro"] = stubs.idapro
+    sys.modules["ida_auto"] = stubs.ida_auto
+    spec = importlib.util.spec_from_file_location("idalib_session_manager", SESSION_MANAGER_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+stubs = IdaStubs()
+session_manager = _load_session_manager(stubs)
+
+
+class SessionListingCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.paths = {}
+        for name in ("a.exe", "b.exe"):
+            path = os.path.join(tmp.name, name)
+            Path(path).touch()
+            self.paths[name] = path
+        stubs.on_auto_wait = None
+        self.manager = session_manager.IDASessionManager()
+
+    def assertListing(self, current, sessions):
+        """Check the cached payload against {filename: is_current} and the live state"""
+        payload = self.manager.get_cached_list_payload()
+        self.assertEqual(payload["count"], len(sessions))
+        self.assertEqual(payload["current_session_id"], current)
+        self.assertIs(payload["sessions"], self.manager.get_cached_sessions_snapshot())
+        self.assertEqual({s["filename"]: s["is_current"] for s in payload["sessions"]}, sessions)
+        for info in payload["sessions"]:
+            session = self.manager.get_session(info["session_id"])
+            self.assertEqual(info["is_analyzing"], session.is_analyzing)
+            self.assertEqual(info["last_accessed"], session.last_accessed.isoformat())
+        # Nothing changed, so the next call reuses the same payload
+        self.assertIs(self.manager.get_cached_list_payload(), payload)
+        return payload
+
+    def test_open_switch_close(self):
+        self.assertListing(None, {})
+        a = self.manager.open_binary(self.paths["a.exe"], session_id="a")
+        self.assertListing("a", {"a.exe": True})
+        b = self.manager.open_binary(self.paths["b.exe"], session_id="b")
+        self.assertListing("b", {"a.exe": False, "b.exe": True})
+
+        self.manager.switch_session("a")
+        self.assertEqual(stubs.open_path, a.input_path)
+        self.assertListing("a", {"a.exe": True, "b.exe": False})
+
+        self.manager.close_session("a")
+        self.assertListing(None, {"b.exe": False})
+        self.manager.switch_session("b")
+        self.assertEqual(stubs.open_path, b.input_path)
+        self.assertListing("b", {"b.exe": True})
+
+    def test_open_already_open(self):
+        a = self.manager.open_binary(self.paths["a.exe"], session_id="a")
+        self.manager.open_binary(self.paths["b.exe"], session_id="b")
+        self.assertListing("b", {"a.exe": False, "b.exe": True})
+        # Reopening through a different spelling of the path reuses the session
+        again = self.manager.open_binary(os.path.join(os.path.dirname(self.paths["a.exe"]), ".", "a.exe"))
+        self.assertIs(again, a)
+        self.assertListing("a", {"a.exe": True, "b.exe": False})
+
+    def test_is_analyzing(self):
+        seen = []
+        stubs.on_auto_wait = lambda: seen.append(self.manager.get_cached_list_payload()["sessions"][0]["is_analyzing"])
+        self.manager.open_binary(self.paths["a.exe"], session_id="a")
+        self.assertEqual(seen, [True])
+        self.assertListing("a", {"a.exe": True})
+
+    def test_is_analyzing_cleared_on_error(self):
+        def interrupt():
+            raise KeyboardInterrupt
+
+        stubs.on_auto_wait = interrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self.manager.open_binary(self.paths["a.exe"], session_id="a")
+        self.assertListing("a", {"a.exe": True})
+
+    def test_close_all(self):
+        self.manager.open_binaries([self.paths["a.exe"], self.paths["b.exe"]])
+        self.assertListing(self.manager.get_current_session().session_id, {"a.exe": False, "b.exe": True})
+        self.manager.close_all_sessions()
+        self.assertListing(None, {})
+        self.assertIsNone(stubs.open_path)
+
+
+if __name__ == "__main__":
+    unittest.main()